@@ -42,12 +42,14 @@ Each event object may be one of:
 Behavior:
 - The script computes "today" in the requested IANA timezone (default: America/Toronto).
 - If one or more events match today, it posts to the Discord webhook.
-- If --state-file is provided, it will not re-send the *same* message content for the same date
-  unless --force is used. This makes it safe for cron retries.
+- If --state-file is provided, it will not send again on a date it has already sent for
+  unless --force is used. The state file is checked before the events file is parsed, so
+  repeated cron runs on an already-sent day are cheap.
 
 Requirements:
 - Python 3.9+ (zoneinfo)
 - requests
+- orjson or ujson (optional, faster JSON parsing)
 """
 
 from __future__ import annotations
@@ -58,12 +60,13 @@ import hashlib
 import json
 import os
 import re
+import string
 import sys
 import time
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, List, Optional, Sequence, Tuple
-from urllib.parse import urlparse
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 try:
     from zoneinfo import ZoneInfo  # Python 3.9+
@@ -75,14 +78,44 @@ try:
 except Exception:
     requests = None  # type: ignore[assignment]
 
+# Optional faster JSON backends; stdlib json is the fallback.
+try:
+    import orjson
+except Exception:
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import ujson
+except Exception:
+    ujson = None  # type: ignore[assignment]
+
+if orjson is not None:
+    _json_loads = orjson.loads
+elif ujson is not None:
+    _json_loads = ujson.loads
+else:
+    _json_loads = json.loads
+
 
 # Discord message content hard limit is 2000 characters.
 DISCORD_MAX_CONTENT_LEN = 2000
 
+# Discord embed limits (per webhook message / per embed).
+DISCORD_MAX_EMBEDS_PER_MESSAGE = 10
+DISCORD_MAX_EMBED_TITLE_LEN = 256
+DISCORD_MAX_EMBED_DESCRIPTION_LEN = 4096
+DISCORD_MAX_EMBED_TOTAL_LEN = 6000
+
 DEFAULT_TZ = "America/Toronto"
 
-_ALLOWED_WEBHOOK_HOST_SUFFIXES = ("discord.com", "discordapp.com")
-_WEBHOOK_PATH_RE = re.compile(r"^/api/webhooks/(\d+)/([\w-]+)$")
+USER_AGENT = "discord-daily-events/1.0"
+
+# https://[subdomain.]discord(app).com[:port]/api/webhooks/<id>/<token>[/][?query]
+_WEBHOOK_URL_RE = re.compile(
+    r"https://(?:[\w-]+\.)*(?:discord\.com|discordapp\.com)(?::\d+)?"
+    r"/api/webhooks/(\d+)/([\w-]+)/*(?:\?[^#]*)?",
+    re.IGNORECASE,
+)
 
 
 def _eprint(msg: str) -> None:
@@ -120,31 +153,67 @@ def _ordinal(n: int) -> str:
     return f"{n}{suffix}"
 
 
-def _sha256_hex(data: str) -> str:
+def _sha256_hex(parts: Iterable[bytes]) -> str:
     h = hashlib.sha256()
-    h.update(data.encode("utf-8"))
+    for part in parts:
+        h.update(part)
     return h.hexdigest()
 
 
+def _iter_joined_utf8(lines: Iterable[str], sep: bytes = b"\n") -> Iterator[bytes]:
+    # Yields the UTF-8 bytes of sep.join(lines) piecewise, without building the joined string.
+    first = True
+    for ln in lines:
+        if not first:
+            yield sep
+        first = False
+        yield ln.encode("utf-8")
+
+
 def _validate_webhook_url(url: str) -> None:
     if not url:
         die("Webhook URL is empty", 2)
 
-    try:
-        parsed = urlparse(url)
-    except Exception as e:
-        die(f"Webhook URL parsing failed: {e}", 2)
+    if not _WEBHOOK_URL_RE.fullmatch(url):
+        die("Invalid Discord webhook URL (expected https://discord.com/api/webhooks/<id>/<token>)", 2)
 
-    if parsed.scheme.lower() != "https":
-        die("Webhook URL must use https", 2)
 
-    host = (parsed.hostname or "").lower()
-    if not host or not any(host == suf or host.endswith("." + suf) for suf in _ALLOWED_WEBHOOK_HOST_SUFFIXES):
-        die(f"Webhook host must be a Discord domain (got '{parsed.netloc}')", 2)
+# Precompiled message template: (literal, field_name, format_spec, conversion) per segment,
+# as produced by string.Formatter().parse(); field_name is None for a trailing literal.
+_TemplatePart = Tuple[str, Optional[str], str, Optional[str]]
 
-    path = (parsed.path or "").rstrip("/")
-    if not _WEBHOOK_PATH_RE.fullmatch(path):
-        die("Invalid Discord webhook URL path format", 2)
+_FORMATTER = string.Formatter()
+
+
+def _compile_template(template: str, *, context: str) -> Tuple[_TemplatePart, ...]:
+    try:
+        parts = tuple(_FORMATTER.parse(template))
+    except ValueError as e:
+        die(f"{context}: invalid template: {e}", 3)
+
+    compiled: List[_TemplatePart] = []
+    for literal, field_name, format_spec, conversion in parts:
+        if format_spec and "{" in format_spec:
+            die(f"{context}: nested placeholders in format specs are not supported", 3)
+        compiled.append((literal, field_name, format_spec or "", conversion))
+    return tuple(compiled)
+
+
+def _render_template(compiled: Sequence[_TemplatePart], mapping: dict[str, str]) -> str:
+    # Raises KeyError for placeholders missing from mapping (same contract as str.format_map).
+    out: List[str] = []
+    for literal, field_name, format_spec, conversion in compiled:
+        if literal:
+            out.append(literal)
+        if field_name is None:
+            continue
+        value = mapping[field_name]
+        if conversion == "r":
+            value = repr(value)
+        elif conversion == "a":
+            value = ascii(value)
+        out.append(format(value, format_spec) if format_spec else value)
+    return "".join(out)
 
 
 @dataclass(frozen=True)
@@ -157,6 +226,7 @@ class Event:
     recurring: bool
     year: Optional[int]       # birth year for birthday (or informational)
     message: Optional[str]    # custom message template
+    compiled_message: Optional[Tuple[_TemplatePart, ...]]  # message parsed once at load time
     mention: str              # mention string (user/role) or empty
     emoji: Optional[str]      # custom emoji override
     index: int                # index in JSON (for error reporting)
@@ -202,8 +272,10 @@ def _normalize_event(obj: dict[str, Any], index: int, *, verbose: bool) -> Optio
         mention = _as_str(obj["mention"], context=f"{ctx}.mention", allow_empty=True)
 
     message = None
+    compiled_message = None
     if "message" in obj and obj["message"] is not None:
         message = _as_str(obj["message"], context=f"{ctx}.message", allow_empty=False)
+        compiled_message = _compile_template(message, context=f"{ctx}.message")
 
     emoji = None
     if "emoji" in obj and obj["emoji"] is not None:
@@ -268,6 +340,7 @@ def _normalize_event(obj: dict[str, Any], index: int, *, verbose: bool) -> Optio
         recurring=recurring,
         year=year,
         message=message,
+        compiled_message=compiled_message,
         mention=mention,
         emoji=emoji,
         index=index,
@@ -281,13 +354,14 @@ def _load_events(events_path: Path, *, verbose: bool) -> List[Event]:
         die(f"Events path is not a file: {events_path}", 3)
 
     try:
-        raw_text = events_path.read_text(encoding="utf-8")
+        raw_bytes = events_path.read_bytes()
     except OSError as e:
         die(f"Failed to read events file '{events_path}': {e}", 4)
 
     try:
-        raw = json.loads(raw_text)
-    except json.JSONDecodeError as e:
+        # All backends accept UTF-8 bytes; decode errors surface as ValueError too.
+        raw = _json_loads(raw_bytes)
+    except ValueError as e:
         die(f"Events file '{events_path}' is not valid JSON: {e}", 3)
 
     if isinstance(raw, dict):
@@ -312,15 +386,25 @@ def _load_events(events_path: Path, *, verbose: bool) -> List[Event]:
     return events
 
 
+@lru_cache(maxsize=8)
+def _get_zoneinfo(name: str) -> "ZoneInfo":
+    assert ZoneInfo is not None
+    return ZoneInfo(name)
+
+
 def _today_in_tz(tz_name: str, *, override_date: Optional[str]) -> _dt.date:
     if override_date is not None:
         return _parse_iso_date(override_date, context="--date")
 
+    # UTC needs no tzdata lookup at all.
+    if tz_name == "UTC":
+        return _dt.datetime.now(tz=_dt.timezone.utc).date()
+
     if ZoneInfo is None:
         die("zoneinfo is unavailable; require Python 3.9+ (or install backports.zoneinfo and adapt code)", 2)
 
     try:
-        tz = ZoneInfo(tz_name)
+        tz = _get_zoneinfo(tz_name)
     except Exception as e:
         die(f"Invalid timezone '{tz_name}': {e}", 2)
 
@@ -328,10 +412,25 @@ def _today_in_tz(tz_name: str, *, override_date: Optional[str]) -> _dt.date:
     return now.date()
 
 
-def _event_matches_today(ev: Event, today: _dt.date) -> bool:
-    if ev.specific_date is not None:
-        return ev.specific_date == today
-    return (ev.month == today.month) and (ev.day == today.day)
+def _build_event_index(events: Sequence[Event]) -> Tuple[Dict[Tuple[int, int], List[Event]], List[Event]]:
+    # Recurring events keyed by (month, day); fixed-date events kept aside (typically few).
+    by_md: Dict[Tuple[int, int], List[Event]] = {}
+    fixed: List[Event] = []
+    for ev in events:
+        if ev.specific_date is not None:
+            fixed.append(ev)
+        else:
+            by_md.setdefault((ev.month, ev.day), []).append(ev)
+    return by_md, fixed
+
+
+def _events_for_day(
+    by_md: Dict[Tuple[int, int], List[Event]], fixed: Sequence[Event], today: _dt.date
+) -> List[Event]:
+    todays = by_md.get((today.month, today.day), []) + [ev for ev in fixed if ev.specific_date == today]
+    # Keep the events-file order regardless of which bucket an event came from.
+    todays.sort(key=lambda ev: ev.index)
+    return todays
 
 
 def _default_emoji(kind: str) -> str:
@@ -342,7 +441,15 @@ def _default_emoji(kind: str) -> str:
     }.get(kind, "📌")
 
 
-def _render_event_message(ev: Event, today: _dt.date) -> str:
+def _color_for_kind(kind: str) -> int:
+    return {
+        "birthday": 0xE91E63,
+        "holiday": 0x2ECC71,
+        "event": 0x3498DB,
+    }.get(kind, 0x3498DB)
+
+
+def _render_event_message(ev: Event, today: _dt.date, *, with_mention: bool = True) -> str:
     emoji = ev.emoji if ev.emoji is not None else _default_emoji(ev.kind)
 
     age: Optional[int] = None
@@ -351,24 +458,26 @@ def _render_event_message(ev: Event, today: _dt.date) -> str:
         if age < 0:
             age = None
 
-    weekday = today.strftime("%A")
-    date_iso = today.isoformat()
-
-    # If user provided a template, format it.
-    if ev.message is not None:
-        mapping = {
-            "name": ev.name,
-            "age": "" if age is None else str(age),
-            "age_ordinal": "" if age is None else _ordinal(age),
-            "date": date_iso,
-            "weekday": weekday,
-            "year": "" if ev.year is None else str(ev.year),
-            "emoji": emoji,
-        }
-        try:
-            rendered = ev.message.format_map(mapping).strip()
-        except KeyError as e:
-            die(f"events[{ev.index}].message references unknown placeholder {e!s}", 3)
+    # If user provided a template, render its precompiled form.
+    compiled = ev.compiled_message
+    if compiled is not None:
+        if all(field_name is None for _, field_name, _, _ in compiled):
+            # Placeholder-free template: no mapping needed.
+            rendered = "".join(literal for literal, _, _, _ in compiled).strip()
+        else:
+            mapping = {
+                "name": ev.name,
+                "age": "" if age is None else str(age),
+                "age_ordinal": "" if age is None else _ordinal(age),
+                "date": today.isoformat(),
+                "weekday": today.strftime("%A"),
+                "year": "" if ev.year is None else str(ev.year),
+                "emoji": emoji,
+            }
+            try:
+                rendered = _render_template(compiled, mapping).strip()
+            except KeyError as e:
+                die(f"events[{ev.index}].message references unknown placeholder {e!s}", 3)
         if not rendered:
             die(f"events[{ev.index}].message rendered to empty content", 3)
         msg = rendered
@@ -385,66 +494,114 @@ def _render_event_message(ev: Event, today: _dt.date) -> str:
             msg = f"{emoji} {ev.name}."
 
     mention = ev.mention.strip()
-    if mention:
+    if with_mention and mention:
         msg = f"{mention} {msg}"
 
     return msg
 
 
+def _build_embed(ev: Event, today: _dt.date) -> dict[str, Any]:
+    # Mentions inside embeds do not ping, so they are carried in the payload content instead.
+    description = _render_event_message(ev, today, with_mention=False)
+    return {
+        "title": ev.name[:DISCORD_MAX_EMBED_TITLE_LEN],
+        "description": description[:DISCORD_MAX_EMBED_DESCRIPTION_LEN],
+        "color": _color_for_kind(ev.kind),
+    }
+
+
+def _build_embed_payloads(events: Sequence[Event], today: _dt.date, *, per_message: int) -> List[dict[str, Any]]:
+    payloads: List[dict[str, Any]] = []
+    embeds: List[dict[str, Any]] = []
+    mentions: List[str] = []
+    total_len = 0
+
+    def flush() -> None:
+        payload: dict[str, Any] = {"embeds": embeds}
+        if mentions:
+            payload["content"] = " ".join(mentions)
+        payloads.append(payload)
+
+    for ev in events:
+        embed = _build_embed(ev, today)
+        size = len(embed["title"]) + len(embed["description"])
+
+        if embeds and (len(embeds) >= per_message or total_len + size > DISCORD_MAX_EMBED_TOTAL_LEN):
+            flush()
+            embeds, mentions, total_len = [], [], 0
+
+        embeds.append(embed)
+        total_len += size
+        mention = ev.mention.strip()
+        if mention and mention not in mentions:
+            mentions.append(mention)
+
+    if embeds:
+        flush()
+
+    return payloads
+
+
 def _split_discord_content(lines: Sequence[str], max_len: int) -> List[str]:
     if max_len <= 0:
         die("--max-content-len must be > 0", 2)
 
     chunks: List[str] = []
-    current = ""
+    # Lines of the chunk being built and its joined length; joined only when flushed.
+    parts: List[str] = []
+    cur_len = 0
 
     for line in lines:
         ln = line.replace("\r\n", "\n").replace("\r", "\n").rstrip()
         if not ln:
             continue
 
-        candidate = ln if not current else current + "\n" + ln
-
-        if len(candidate) <= max_len:
-            current = candidate
+        extra = len(ln) + (1 if parts else 0)
+        if cur_len + extra <= max_len:
+            parts.append(ln)
+            cur_len += extra
             continue
 
-        if current:
-            chunks.append(current)
-            current = ln
-            if len(current) <= max_len:
-                continue
+        if parts:
+            chunks.append("\n".join(parts))
+            parts = []
+            cur_len = 0
 
-        while len(current) > max_len:
-            chunks.append(current[:max_len])
-            current = current[max_len:]
+        if len(ln) > max_len:
+            # Hard-wrap an over-long line; the tail (<= max_len) may share a chunk with later lines.
+            cut = len(ln) - (len(ln) % max_len or max_len)
+            chunks.extend(ln[i:i + max_len] for i in range(0, cut, max_len))
+            ln = ln[cut:]
 
-    if current:
-        chunks.append(current)
+        parts.append(ln)
+        cur_len = len(ln)
+
+    if parts:
+        chunks.append("\n".join(parts))
 
     return chunks
 
 
 def _read_state(state_path: Path, *, verbose: bool) -> Optional[Tuple[str, str]]:
     try:
-        text = state_path.read_text(encoding="utf-8").strip()
+        data = state_path.read_bytes().strip()
     except FileNotFoundError:
         return None
     except OSError as e:
         warn(f"Failed to read state file '{state_path}': {e} (continuing without state)", verbose=verbose)
         return None
 
-    if not text:
+    if not data:
         return None
 
     try:
-        obj = json.loads(text)
+        obj = _json_loads(data)
         if isinstance(obj, dict):
             last_sent = str(obj.get("last_sent", "")).strip()
             sha = str(obj.get("sha256", "")).strip()
             if last_sent and sha:
                 return (last_sent, sha)
-    except json.JSONDecodeError:
+    except ValueError:
         pass
 
     warn(f"State file '{state_path}' is not in expected JSON format; ignoring it", verbose=verbose)
@@ -452,27 +609,38 @@ def _read_state(state_path: Path, *, verbose: bool) -> Optional[Tuple[str, str]]
 
 
 def _write_state(state_path: Path, last_sent: str, sha256_hex: str) -> None:
-    state_obj = {"last_sent": last_sent, "sha256": sha256_hex}
+    # Both values are generated by this script (ISO date, hex digest), so no JSON escaping is needed.
+    text = f'{{\n  "last_sent": "{last_sent}",\n  "sha256": "{sha256_hex}"\n}}\n'
     tmp_path = state_path.with_suffix(state_path.suffix + ".tmp")
     try:
         tmp_path.parent.mkdir(parents=True, exist_ok=True)
-        tmp_path.write_text(json.dumps(state_obj, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        tmp_path.write_text(text, encoding="utf-8")
         os.replace(tmp_path, state_path)
     except OSError as e:
-        die(f"Failed to write state file '{state_path}': {e}", 4)
-    finally:
+        # os.replace already consumed the temp file on success; only a partial write leaves one behind.
         try:
-            if tmp_path.exists():
-                tmp_path.unlink(missing_ok=True)  # type: ignore[arg-type]
-        except Exception:
+            tmp_path.unlink(missing_ok=True)
+        except OSError:
             pass
+        die(f"Failed to write state file '{state_path}': {e}", 4)
 
 
-def _http_get_verify(url: str, *, timeout: Tuple[float, float], verbose: bool) -> None:
+def _build_session() -> "requests.Session":
+    # One keep-alive connection shared by the verify GET and every POST (single TLS handshake).
+    assert requests is not None
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=0)
+    session.mount("https://", adapter)
+    session.headers["User-Agent"] = USER_AGENT
+    return session
+
+
+def _http_get_verify(
+    session: "requests.Session", url: str, *, timeout: Tuple[float, float], verbose: bool
+) -> None:
     assert requests is not None
-    headers = {"User-Agent": "discord-daily-events/1.0"}
     try:
-        r = requests.get(url, headers=headers, timeout=timeout)
+        r = session.get(url, timeout=timeout)
     except requests.RequestException as e:
         die(f"Webhook verification GET failed: {e}", 4)
 
@@ -482,16 +650,21 @@ def _http_get_verify(url: str, *, timeout: Tuple[float, float], verbose: bool) -
     info("Webhook verification GET succeeded.", verbose=verbose)
 
 
-def _http_post_discord(url: str, content: str, *, timeout: Tuple[float, float], retries: int, verbose: bool) -> None:
+def _http_post_discord(
+    session: "requests.Session",
+    url: str,
+    payload: dict[str, Any],
+    *,
+    timeout: Tuple[float, float],
+    retries: int,
+    verbose: bool,
+) -> None:
     assert requests is not None
 
-    headers = {"User-Agent": "discord-daily-events/1.0"}
-    payload = {"content": content}
-
     last_exc: Optional[str] = None
     for attempt in range(retries + 1):
         try:
-            r = requests.post(url, json=payload, headers=headers, timeout=timeout)
+            r = session.post(url, json=payload, timeout=timeout)
         except requests.RequestException as e:
             last_exc = str(e)
             if attempt >= retries:
@@ -544,6 +717,11 @@ def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
     p.add_argument("--dry-run", action="store_true", help="Do not post to Discord; print message(s) to stdout")
     p.add_argument("--verbose", action="store_true", help="Enable verbose diagnostics to stderr")
     p.add_argument("--split-messages", action="store_true", help="Send one Discord message per event (default: combined)")
+    p.add_argument(
+        "--use-embeds",
+        action="store_true",
+        help=f"Send events as embeds, up to {DISCORD_MAX_EMBEDS_PER_MESSAGE} per message (default: plain content)",
+    )
     p.add_argument("--state-file", default=None, help="Path to state JSON file for idempotency (recommended for cron)")
     p.add_argument("--force", action="store_true", help="Ignore state file and send anyway")
     p.add_argument("--verify-webhook", action="store_true", help="Perform a GET to verify webhook URL before posting")
@@ -581,55 +759,64 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     args = parse_args(argv)
 
     today = _today_in_tz(args.tz, override_date=args.date)
+
+    # Idempotency check (optional). Done before loading events so already-sent runs skip all parsing.
+    # --dry-run ignores the state file.
+    state_path: Optional[Path] = Path(args.state_file) if args.state_file else None
+    if state_path is not None and not args.force and not args.dry_run:
+        st = _read_state(state_path, verbose=args.verbose)
+        if st is not None and st[0] == today.isoformat():
+            info("State indicates today's message already sent; exiting.", verbose=args.verbose)
+            return 0
+
     events = _load_events(Path(args.events_file), verbose=args.verbose)
 
-    todays_events = [ev for ev in events if _event_matches_today(ev, today)]
+    by_md, fixed = _build_event_index(events)
+    todays_events = _events_for_day(by_md, fixed, today)
 
     if not todays_events:
         info(f"No matching events for {today.isoformat()} in timezone {args.tz}.", verbose=args.verbose)
         return 0
 
     lines = [_render_event_message(ev, today) for ev in todays_events]
-    combined_for_state = "\n".join(lines)
 
-    if args.split_messages:
-        message_units: List[str] = []
-        for ln in lines:
-            message_units.extend(_split_discord_content([ln], args.max_content_len))
+    payloads: List[dict[str, Any]]
+    if args.use_embeds:
+        per_message = 1 if args.split_messages else DISCORD_MAX_EMBEDS_PER_MESSAGE
+        payloads = _build_embed_payloads(todays_events, today, per_message=per_message)
     else:
-        message_units = _split_discord_content(lines, args.max_content_len)
+        if args.split_messages:
+            message_units: List[str] = []
+            for ln in lines:
+                message_units.extend(_split_discord_content([ln], args.max_content_len))
+        else:
+            message_units = _split_discord_content(lines, args.max_content_len)
+        payloads = [{"content": msg} for msg in message_units if msg.strip()]
 
     if args.dry_run:
         # Print exactly what would be sent (ignores --state-file).
-        for i, msg in enumerate(message_units):
+        for i, payload in enumerate(payloads):
             if i:
                 print("\n---\n")
-            print(msg)
+            if args.use_embeds:
+                print(json.dumps(payload, indent=2, ensure_ascii=False))
+            else:
+                print(payload["content"])
         return 0
 
-    # Idempotency check (optional)
-    state_path: Optional[Path] = Path(args.state_file) if args.state_file else None
-    digest = _sha256_hex(combined_for_state)
-    if state_path is not None and not args.force:
-        st = _read_state(state_path, verbose=args.verbose)
-        if st is not None:
-            last_sent_date, last_sent_sha = st
-            if last_sent_date == today.isoformat() and last_sent_sha == digest:
-                info("State indicates today's message already sent; exiting.", verbose=args.verbose)
-                return 0
-
     timeout = (float(args.connect_timeout), float(args.read_timeout))
 
-    if args.verify_webhook:
-        _http_get_verify(args.webhook, timeout=timeout, verbose=args.verbose)
+    with _build_session() as session:
+        if args.verify_webhook:
+            _http_get_verify(session, args.webhook, timeout=timeout, verbose=args.verbose)
 
-    for msg in message_units:
-        if not msg.strip():
-            continue
-        _http_post_discord(args.webhook, msg, timeout=timeout, retries=int(args.retries), verbose=args.verbose)
+        for payload in payloads:
+            _http_post_discord(
+                session, args.webhook, payload, timeout=timeout, retries=int(args.retries), verbose=args.verbose
+            )
 
     if state_path is not None:
-        _write_state(state_path, today.isoformat(), digest)
+        _write_state(state_path, today.isoformat(), _sha256_hex(_iter_joined_utf8(lines)))
 
     return 0
 